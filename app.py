@@ -4,14 +4,25 @@ ByUsiCDN - Index Fo 服务器
 支持URL参数路径分享和优化的UI
 """
 
+import gzip
+import hashlib
 import http.server
-import socketserver
 import os
 import json
 import urllib.parse
+import zlib
 import logging
+import mimetypes
+import platform
+import socket
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path
+from stat import S_ISDIR, S_ISREG
 import sys
 from typing import Dict, Any
 
@@ -39,6 +50,34 @@ except ImportError:
     HAS_RICH = False
     logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# 可选使用orjson加速JSON序列化
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# 可选支持CBOR二进制响应格式，体积比JSON更小
+try:
+    import cbor2
+    HAS_CBOR = True
+except ImportError:
+    HAS_CBOR = False
+
+# 可选支持brotli压缩，不可用时只使用gzip
+try:
+    import brotli
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
+# 可选使用psutil获取内存、磁盘和运行时间
+try:
+    import psutil
+    HAS_PSUTIL = True
+except ImportError:
+    HAS_PSUTIL = False
+
 # 配置
 CONFIG = {
     "host": "0.0.0.0",
@@ -48,17 +87,261 @@ CONFIG = {
     "blur_intensity": "25px",
     "site_title": "ByUsiCDN - Index Fo",
     "html_file": "index.html",
-    "protected_paths": ["/api/secret", "/api/admin"]
+    "protected_paths": ["/api/secret", "/api/admin"],
+    "workers": 1
 }
 
+# 解析后的cdnData根目录，启动时计算一次
+_CDN_ROOT = os.path.realpath(CONFIG["cdn_data_folder"])
+
+# 受保护的路径，精确匹配
+_PROTECTED_PATHS = frozenset(CONFIG["protected_paths"])
+
+def _is_inside_cdn_root(path) -> bool:
+    """判断路径解析符号链接后是否位于cdnData目录内"""
+    try:
+        return os.path.commonpath([os.path.realpath(path), _CDN_ROOT]) == _CDN_ROOT
+    except ValueError:
+        # Windows下不同盘符的路径无法比较
+        return False
+
+# 目录列表缓存: relative_path -> (目录mtime_ns, 写入时间, 列表数据)
+# 目录mtime只在增删改名时变化，因此再配合TTL让文件内容变化也能及时反映
+_LIST_CACHE: "OrderedDict[str, tuple]" = OrderedDict()
+_LIST_CACHE_LOCK = threading.Lock()
+_LIST_CACHE_TTL = 5.0
+_LIST_CACHE_SIZE = 512
+
+# 空目录列表的公共字段，不可变的列表用元组表示，避免被意外修改
+_EMPTY_LISTING = {
+    "files": (),
+    "folders": (),
+    "folder_count": 0,
+    "file_count": 0,
+    "total_size": "0 B",
+    "total_size_bytes": 0
+}
+
+# 文件数达到阈值的目录列表改为分批编码、chunked流式发送
+_STREAM_THRESHOLD = 5000
+_STREAM_BATCH = 1000
+
+# 递归索引的并行扫描线程数和最多扫描的目录数
+_INDEX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+_INDEX_MAX_FOLDERS = 10000
+
+# API响应压缩：小于阈值的响应不压缩，压缩结果按(ETag, 编码)缓存
+_COMPRESS_MIN_SIZE = 1024
+_COMPRESS_LEVEL = 5
+_COMPRESS_CACHE: "OrderedDict[tuple, bytes]" = OrderedDict()
+_COMPRESS_CACHE_LOCK = threading.Lock()
+_COMPRESS_CACHE_SIZE = 256
+
+# 已编码响应的缓存: (id(数据), 是否CBOR) -> (数据, 编码结果, ETag)
+# 列表缓存和统计缓存命中时返回的是同一个dict对象，据此复用编码结果
+_ENCODED_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+_ENCODED_CACHE_LOCK = threading.Lock()
+_ENCODED_CACHE_SIZE = 256
+
+# 静态文件扩展名到Content-Type的映射
+_MIME_TYPES = {
+    '.txt': 'text/plain; charset=utf-8',
+    '.html': 'text/html; charset=utf-8',
+    '.htm': 'text/html; charset=utf-8',
+    '.css': 'text/css; charset=utf-8',
+    '.js': 'application/javascript; charset=utf-8',
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.gif': 'image/gif',
+    '.pdf': 'application/pdf',
+    '.zip': 'application/zip',
+    '.ico': 'image/x-icon',
+    '.svg': 'image/svg+xml',
+    '.json': 'application/json',
+    '.xml': 'application/xml'
+}
+
+# 没有os.sendfile的平台（如Windows）上，文件按1 MiB分块读出后发送
+_HAS_SENDFILE = hasattr(os, 'sendfile')
+_SEND_BLOCK_SIZE = 1 << 20
+
+# 扩展名到文件类型的映射
+_FILE_TYPES = {
+    '.jpg': 'image', '.jpeg': 'image', '.png': 'image', '.gif': 'image', '.bmp': 'image', '.webp': 'image',
+    '.pdf': 'document', '.doc': 'document', '.docx': 'document', '.ppt': 'document', '.pptx': 'document',
+    '.txt': 'text', '.md': 'text', '.json': 'text', '.xml': 'text', '.csv': 'text',
+    '.zip': 'archive', '.rar': 'archive', '.7z': 'archive', '.tar': 'archive', '.gz': 'archive',
+    '.mp4': 'video', '.avi': 'video', '.mkv': 'video', '.mov': 'video', '.wmv': 'video',
+    '.mp3': 'audio', '.wav': 'audio', '.flac': 'audio', '.aac': 'audio', '.ogg': 'audio',
+    '.exe': 'executable', '.msi': 'executable'
+}
+
+# 文件大小单位及对应的除数
+_SIZE_UNITS = tuple((unit, 1 << (10 * i)) for i, unit in enumerate(('B', 'KB', 'MB', 'GB', 'TB', 'PB')))
+
+# 系统统计缓存：仪表盘会定时轮询/api/stats，短时间内直接复用上次结果
+_STATS_TTL = 1.0
+_STATS_CACHE: Dict[str, Any] = {"time": 0.0, "data": None, "boot_time": None}
+
+# 平台信息在进程运行期间不会变化，启动时获取一次
+_SYSTEM_INFO = {
+    "platform": platform.system(),
+    "platform_version": platform.version(),
+    "processor": platform.processor(),
+    "hostname": platform.node()
+}
+
+# JavaScript字符串转义表，单次translate完成全部替换
+# 与json.dumps一样转义全部控制字符；同时转义'<'防止路径中的</script>提前结束脚本块
+_JS_ESCAPE_TABLE = str.maketrans({
+    **{chr(code): '\\u%04x' % code for code in range(0x20)},
+    '\\': '\\\\',
+    '"': '\\"',
+    "'": "\\'",
+    '\n': '\\n',
+    '\r': '\\r',
+    '<': '\\u003c',
+    '\u2028': '\\u2028',
+    '\u2029': '\\u2029'
+})
+
+@lru_cache(maxsize=1024)
+def _content_type(ext: str) -> str:
+    """按扩展名确定Content-Type，内置表优先，其余交给mimetypes，结果按扩展名缓存"""
+    content_type = _MIME_TYPES.get(ext)
+    if content_type is None:
+        content_type = mimetypes.guess_type('file' + ext)[0] or 'application/octet-stream'
+    return content_type
+
+@lru_cache(maxsize=4096)
+def _format_mtime(timestamp: int) -> str:
+    """格式化修改时间，批量上传的文件常共享同一秒，按秒缓存结果"""
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp))
+
+# 注入初始路径的脚本片段，路径插入在两段之间
+_INJECT_PREFIX = '''
+        <script>
+            // 从URL参数注入的初始路径
+            const initialPathFromURL = "'''.encode('utf-8')
+_INJECT_SUFFIX = '''";
+        </script>
+        '''.encode('utf-8')
+
+def _etag(payload: bytes) -> str:
+    """根据响应内容计算弱ETag"""
+    return 'W/"%s"' % hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+def _encode(data: Dict[str, Any], cbor: bool = False) -> tuple:
+    """编码API数据并计算ETag，同一数据对象只编码一次"""
+    key = (id(data), cbor)
+    with _ENCODED_CACHE_LOCK:
+        cached = _ENCODED_CACHE.get(key)
+        # 缓存持有数据对象的引用，id不会被复用；is比较排除已被替换的旧对象
+        if cached is not None and cached[0] is data:
+            _ENCODED_CACHE.move_to_end(key)
+            return cached[1], cached[2]
+    
+    payload = cbor2.dumps(data) if cbor else _dumps(data)
+    etag = _etag(payload)
+    
+    with _ENCODED_CACHE_LOCK:
+        _ENCODED_CACHE[key] = (data, payload, etag)
+        _ENCODED_CACHE.move_to_end(key)
+        while len(_ENCODED_CACHE) > _ENCODED_CACHE_SIZE:
+            _ENCODED_CACHE.popitem(last=False)
+    return payload, etag
+
+def _compress(payload: bytes, encoding: str, etag: str) -> bytes:
+    """按指定编码压缩响应体，相同内容只压缩一次"""
+    key = (etag, encoding)
+    with _COMPRESS_CACHE_LOCK:
+        body = _COMPRESS_CACHE.get(key)
+        if body is not None:
+            _COMPRESS_CACHE.move_to_end(key)
+            return body
+    
+    if encoding == 'br':
+        body = brotli.compress(payload, quality=4)
+    else:
+        body = gzip.compress(payload, _COMPRESS_LEVEL, mtime=0)
+    
+    with _COMPRESS_CACHE_LOCK:
+        _COMPRESS_CACHE[key] = body
+        while len(_COMPRESS_CACHE) > _COMPRESS_CACHE_SIZE:
+            _COMPRESS_CACHE.popitem(last=False)
+    return body
+
+# 标准库回退使用的编码器：json.dumps带非默认参数时每次调用都会新建编码器，
+# 这里只创建一次，并使用与orjson一致的紧凑分隔符
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+def _dumps(obj: Any) -> bytes:
+    """序列化为UTF-8编码的JSON字节"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return _JSON_ENCODER.encode(obj).encode('utf-8')
+
 class ByUsiCDNRequestHandler(http.server.SimpleHTTPRequestHandler):
     """ByUsiCDN自定义请求处理器"""
     
-    def __init__(self, *args, **kwargs):
-        self.cdn_path = Path(CONFIG["cdn_data_folder"])
-        self.protected_paths = CONFIG["protected_paths"]
-        self.html_content = self.load_html_template()
-        super().__init__(*args, **kwargs)
+    # 启用HTTP/1.1长连接，所有响应都必须带有Content-Length
+    protocol_version = "HTTP/1.1"
+    
+    # 关闭Nagle算法，避免小响应被延迟发送
+    disable_nagle_algorithm = True
+    
+    # 空闲长连接的超时时间，避免断开的客户端一直占用处理线程
+    timeout = 30
+    
+    # 精确匹配的路由: 路径 -> (处理方法名, 是否需要path参数)
+    _ROUTES = {
+        '/': ('serve_index', True),
+        '/api/files': ('serve_files_api', True),
+        '/api/navigate': ('serve_navigate_api', True),
+        '/api/index': ('serve_folder_index_api', True),
+        '/api/stats': ('serve_stats_api', False)
+    }
+    
+    # HTML模板在类级别缓存，所有连接共享，模板文件未修改时不再读取
+    # 缓存内容: (模板文件mtime, 模板内容, 预编码的切分结果)
+    _html_cache = None
+    
+    # 带缓冲的wfile：响应头和较小的响应体合并为一次send，请求结束时统一flush
+    wbufsize = 64 * 1024
+    
+    # cdnData根目录，使用启动时解析好的绝对路径
+    cdn_path = Path(_CDN_ROOT)
+    
+    @property
+    def html_content(self) -> str:
+        """获取缓存的HTML模板"""
+        return self.get_html_cache()[1]
+    
+    def get_html_parts(self):
+        """获取预编码的模板，返回(完整页面, </head>之前部分, </head>及之后部分)"""
+        return self.get_html_cache()[2]
+    
+    def get_html_cache(self):
+        """获取HTML模板缓存，模板文件的mtime变化后重新加载"""
+        cls = type(self)
+        try:
+            mtime = os.stat(CONFIG["html_file"]).st_mtime_ns
+        except OSError:
+            mtime = None
+        
+        cache = cls._html_cache
+        if cache is None or cache[0] != mtime:
+            html_content = self.load_html_template()
+            html_bytes = html_content.encode('utf-8')
+            head, marker, tail = html_bytes.partition(b'</head>')
+            if marker:
+                parts = (html_bytes, head, marker + tail)
+            else:
+                parts = (html_bytes, None, None)
+            # 整体替换元组，其他线程不会读到新旧混合的状态
+            cache = cls._html_cache = (mtime, html_content, parts)
+        return cache
     
     def load_html_template(self) -> str:
         """加载HTML模板文件"""
@@ -110,10 +393,8 @@ class ByUsiCDNRequestHandler(http.server.SimpleHTTPRequestHandler):
     
     def translate_path(self, path):
         """重写路径转换，将所有非API路径映射到 cdnData 目录"""
-        # 解析路径
-        path = urllib.parse.unquote(path)
-        path = path.split('?', 1)[0]
-        path = path.split('#', 1)[0]
+        # 解析路径：先去掉查询和片段再解码，文件名中编码的'?'和'#'得以保留
+        path = urllib.parse.unquote(path.partition('?')[0].partition('#')[0])
         
         # 检查是否是API路径
         if path.startswith('/api/'):
@@ -129,16 +410,14 @@ class ByUsiCDNRequestHandler(http.server.SimpleHTTPRequestHandler):
             path = path[1:]
         
         # 构建实际文件路径
-        file_path = self.cdn_path / path
+        file_path = os.path.join(_CDN_ROOT, path)
         
         # 安全检查：确保路径在cdnData目录内
-        try:
-            file_path.resolve().relative_to(self.cdn_path.resolve())
-        except ValueError:
+        if not _is_inside_cdn_root(file_path):
             self.log_error("Path traversal attempt: %s", path)
             return "/dev/null"
         
-        return str(file_path)
+        return file_path
     
     def send_error_response(self, code, message):
         """发送错误响应，处理编码问题"""
@@ -151,10 +430,6 @@ class ByUsiCDNRequestHandler(http.server.SimpleHTTPRequestHandler):
             }
             english_message = error_messages.get(code, "Error")
             
-            self.send_response(code)
-            self.send_header('Content-type', 'text/html; charset=utf-8')
-            self.end_headers()
-            
             error_html = f"""
             <!DOCTYPE html>
             <html>
@@ -175,7 +450,13 @@ class ByUsiCDNRequestHandler(http.server.SimpleHTTPRequestHandler):
             </body>
             </html>
             """
-            self.wfile.write(error_html.encode('utf-8'))
+            body = error_html.encode('utf-8')
+            
+            self.send_response(code)
+            self.send_header('Content-type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
         except Exception as e:
             # 如果自定义错误也失败，使用原始方法
             super().send_error(code, english_message)
@@ -183,32 +464,24 @@ class ByUsiCDNRequestHandler(http.server.SimpleHTTPRequestHandler):
     def do_GET(self):
         """处理GET请求"""
         try:
-            parsed_path = urllib.parse.urlparse(self.path)
-            path = parsed_path.path
-            query_params = urllib.parse.parse_qs(parsed_path.query)
+            path, _, query = self.path.partition('?')
             
             # 检查保护路径 - 只保护特定的API路径
-            for protected_path in self.protected_paths:
-                if path == protected_path:
-                    self.send_error_response(403, "Protected directory access denied")
-                    return
+            if path in _PROTECTED_PATHS:
+                self.send_error_response(403, "Protected directory access denied")
+                return
             
-            if path == '/':
-                # 处理根路径，支持path参数
-                target_path = query_params.get('path', [''])[0]
-                self.serve_index(target_path)
-            elif path == '/api/files':
-                # 支持路径参数
-                target_path = query_params.get('path', [''])[0]
-                self.serve_files_api(target_path)
+            route = self._ROUTES.get(path)
+            if route is not None:
+                # 精确匹配的路由，只有需要时才解析path参数
+                handler_name, takes_path = route
+                handler = getattr(self, handler_name)
+                if takes_path:
+                    handler(self.get_query_path(query))
+                else:
+                    handler()
             elif path.startswith('/download/'):
                 self.serve_file_download(path)
-            elif path == '/api/stats':
-                self.serve_stats_api()
-            elif path == '/api/navigate':
-                # 文件夹导航API
-                target_path = query_params.get('path', [''])[0]
-                self.serve_navigate_api(target_path)
             elif path.startswith('/api/'):
                 # 其他API路径返回404
                 self.send_error_response(404, f"API endpoint not found: {path}")
@@ -220,56 +493,46 @@ class ByUsiCDNRequestHandler(http.server.SimpleHTTPRequestHandler):
             self.log_error("Request processing error: %s", str(e))
             self.send_error_response(500, f"Server error: {str(e)}")
     
+    @staticmethod
+    def get_query_path(query: str) -> str:
+        """从查询字符串中提取path参数"""
+        if query:
+            for key, value in urllib.parse.parse_qsl(query):
+                if key == 'path':
+                    return value
+        return ''
+    
     def serve_cdn_file(self, path):
         """服务CDN文件 - 直接映射到cdnData目录"""
         try:
             # 使用translate_path获取实际文件路径
             file_path = self.translate_path(path)
             
-            # 检查文件是否存在
-            if not os.path.exists(file_path) or file_path == "/dev/null":
+            # 检查文件是否存在，只stat一次
+            try:
+                file_stat = None if file_path == "/dev/null" else os.stat(file_path)
+            except OSError:
+                file_stat = None
+            if file_stat is None:
                 self.send_error_response(404, f"File not found: {path}")
                 return
             
             # 如果是目录，返回文件列表页面
-            if os.path.isdir(file_path):
+            if S_ISDIR(file_stat.st_mode):
                 # 对于目录，我们返回首页，但注入路径参数
                 relative_path = path[1:] if path.startswith('/') else path
                 self.serve_index(relative_path)
                 return
             
             # 确定MIME类型
-            ext = os.path.splitext(file_path)[1].lower()
-            mime_types = {
-                '.txt': 'text/plain; charset=utf-8',
-                '.html': 'text/html; charset=utf-8',
-                '.htm': 'text/html; charset=utf-8',
-                '.css': 'text/css; charset=utf-8',
-                '.js': 'application/javascript; charset=utf-8',
-                '.png': 'image/png',
-                '.jpg': 'image/jpeg',
-                '.jpeg': 'image/jpeg',
-                '.gif': 'image/gif',
-                '.pdf': 'application/pdf',
-                '.zip': 'application/zip',
-                '.ico': 'image/x-icon',
-                '.svg': 'image/svg+xml',
-                '.json': 'application/json',
-                '.xml': 'application/xml'
-            }
-            
-            content_type = mime_types.get(ext, 'application/octet-stream')
+            content_type = _content_type(os.path.splitext(file_path)[1].lower())
             
-            # 读取并发送文件
+            # 发送文件，内容不经过Python内存
             with open(file_path, 'rb') as f:
-                file_data = f.read()
-            
-            self.send_response(200)
-            self.send_header('Content-type', content_type)
-            self.send_header('Content-Length', str(len(file_data)))
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(file_data)
+                self.send_file(f, file_stat.st_size, {
+                    'Content-type': content_type,
+                    'Access-Control-Allow-Origin': '*'
+                })
             
         except Exception as e:
             self.log_error("File serving error: %s", str(e))
@@ -279,45 +542,134 @@ class ByUsiCDNRequestHandler(http.server.SimpleHTTPRequestHandler):
         """服务首页，支持路径参数"""
         try:
             # 注入路径参数到HTML中
-            html_content = self.inject_path_parameter(self.html_content, target_path)
+            body = self.inject_path_parameter(target_path)
             
             self.send_response(200)
             self.send_header('Content-type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
             self.end_headers()
-            self.wfile.write(html_content.encode('utf-8'))
+            self.wfile.write(body)
         except Exception as e:
             self.log_error("Index serving error: %s", str(e))
             self.send_error_response(500, f"Index serving error: {str(e)}")
     
-    def inject_path_parameter(self, html_content: str, path: str) -> str:
-        """将路径参数注入到HTML中"""
-        if not path:
-            return html_content
-        
-        # 使用JavaScript变量注入路径参数
-        script_injection = f'''
-        <script>
-            // 从URL参数注入的初始路径
-            const initialPathFromURL = "{self.escape_js_string(path)}";
-        </script>
-        '''
+    def inject_path_parameter(self, path: str) -> bytes:
+        """将路径参数注入到HTML中，返回编码后的页面"""
+        html_bytes, html_head, html_tail = self.get_html_parts()
+        if not path or html_head is None:
+            return html_bytes
         
-        # 在head标签结束前注入
-        return html_content.replace('</head>', f'{script_injection}</head>')
+        # 在head标签结束前注入，脚本的固定部分已预先编码，只需编码转义后的路径
+        return b''.join((
+            html_head,
+            _INJECT_PREFIX,
+            self.escape_js_string(path).encode('utf-8'),
+            _INJECT_SUFFIX,
+            html_tail
+        ))
     
-    def escape_js_string(self, s: str) -> str:
+    @staticmethod
+    def escape_js_string(s: str) -> str:
         """转义字符串用于JavaScript"""
-        return s.replace('\\', '\\\\').replace('"', '\\"').replace("'", "\\'").replace('\n', '\\n').replace('\r', '\\r')
+        return s.translate(_JS_ESCAPE_TABLE)
+    
+    def send_payload(self, payload: bytes, content_type: str = 'application/json; charset=utf-8',
+                     status: int = 200, etag: str = None):
+        """发送已编码的API响应，支持ETag协商缓存和gzip/br压缩"""
+        if etag is None:
+            etag = _etag(payload)
+        if status == 200 and etag in self.headers.get('If-None-Match', ''):
+            # 内容未变化，客户端直接使用本地缓存
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Vary', 'Accept, Accept-Encoding')
+            self.end_headers()
+            return
+        
+        encoding = self.accepted_encoding() if len(payload) >= _COMPRESS_MIN_SIZE else ''
+        if encoding:
+            payload = _compress(payload, encoding, etag)
+        
+        self.send_response(status)
+        self.send_header('Content-type', content_type)
+        self.send_header('Content-Length', str(len(payload)))
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        self.send_header('ETag', etag)
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Vary', 'Accept, Accept-Encoding')
+        self.end_headers()
+        self.wfile.write(payload)
+    
+    def accepted_encoding(self) -> str:
+        """根据Accept-Encoding选择响应压缩方式，优先br"""
+        accept_encoding = self.headers.get('Accept-Encoding', '')
+        if HAS_BROTLI and 'br' in accept_encoding:
+            return 'br'
+        if 'gzip' in accept_encoding:
+            return 'gzip'
+        return ''
+    
+    def wants_cbor(self) -> bool:
+        """客户端是否通过Accept头请求CBOR格式"""
+        return HAS_CBOR and 'application/cbor' in self.headers.get('Accept', '')
+    
+    def send_api_data(self, data: Dict[str, Any]):
+        """按Accept头选择CBOR或JSON编码并发送API数据"""
+        if self.wants_cbor():
+            payload, etag = _encode(data, cbor=True)
+            self.send_payload(payload, 'application/cbor', etag=etag)
+        else:
+            payload, etag = _encode(data)
+            self.send_payload(payload, etag=etag)
+    
+    def send_listing(self, listing: Dict[str, Any]):
+        """发送目录列表，文件数量很多时分批编码并以chunked方式流式发送"""
+        files = listing["files"]
+        if len(files) < _STREAM_THRESHOLD or self.request_version == 'HTTP/1.0' or self.wants_cbor():
+            self.send_api_data(listing)
+            return
+        
+        # 流式发送时用gzip增量压缩
+        compressor = None
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            compressor = zlib.compressobj(_COMPRESS_LEVEL, zlib.DEFLATED, 31)
+        
+        self.send_response(200)
+        self.send_header('Content-type', 'application/json; charset=utf-8')
+        self.send_header('Transfer-Encoding', 'chunked')
+        if compressor:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Vary', 'Accept, Accept-Encoding')
+        self.end_headers()
+        
+        def write(data: bytes):
+            self.write_chunk(compressor.compress(data) if compressor else data)
+        
+        # 先输出files数组，每批单独编码，峰值内存只与批大小相关
+        write(b'{"files":[')
+        for start in range(0, len(files), _STREAM_BATCH):
+            batch = _dumps(files[start:start + _STREAM_BATCH])[1:-1]
+            write(batch if start == 0 else b',' + batch)
+        
+        # 其余字段编码后去掉开头的'{'接在数组之后
+        rest = _dumps({key: value for key, value in listing.items() if key != "files"})
+        write(b'],' + rest[1:])
+        if compressor:
+            self.write_chunk(compressor.flush())
+        self.wfile.write(b'0\r\n\r\n')
+    
+    def write_chunk(self, data: bytes):
+        """写入一个HTTP chunked编码的数据块，空数据会被跳过以免提前结束响应"""
+        if data:
+            self.wfile.write(b'%x\r\n%s\r\n' % (len(data), data))
     
     def serve_files_api(self, target_path: str = ""):
         """服务文件列表API"""
         try:
             files_data = self.scan_cdn_folder(target_path)
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json; charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(json.dumps(files_data, ensure_ascii=False).encode('utf-8'))
+            self.send_listing(files_data)
         except Exception as e:
             self.log_error("Folder scanning error: %s", str(e))
             self.send_error_response(500, f"Folder scanning error: {str(e)}")
@@ -326,24 +678,56 @@ class ByUsiCDNRequestHandler(http.server.SimpleHTTPRequestHandler):
         """服务文件夹导航API"""
         try:
             navigation_data = self.get_navigation_data(target_path)
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json; charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(json.dumps(navigation_data, ensure_ascii=False).encode('utf-8'))
+            self.send_listing(navigation_data)
         except Exception as e:
             self.log_error("Navigation error: %s", str(e))
             self.send_error_response(500, f"Navigation error: {str(e)}")
     
+    def serve_folder_index_api(self, target_path: str = ""):
+        """服务递归索引API，并行扫描所有子目录并写入列表缓存"""
+        try:
+            self.send_api_data(self.build_folder_index(target_path))
+        except Exception as e:
+            self.log_error("Indexing error: %s", str(e))
+            self.send_error_response(500, f"Indexing error: {str(e)}")
+    
+    def build_folder_index(self, relative_path: str = "") -> Dict[str, Any]:
+        """逐层并行扫描目录树，扫描结果同时写入列表缓存，之后的/api/files请求可直接命中"""
+        folder_count = 0
+        file_count = 0
+        total_size = 0
+        truncated = False
+        
+        level = [relative_path]
+        with ThreadPoolExecutor(max_workers=_INDEX_WORKERS) as executor:
+            while level:
+                next_level = []
+                for listing in executor.map(self.scan_cdn_folder, level):
+                    folder_count += listing["folder_count"]
+                    file_count += listing["file_count"]
+                    total_size += listing["total_size_bytes"]
+                    next_level.extend(folder["path"] for folder in listing["folders"])
+                
+                # 限制扫描的目录总数，防止符号链接成环或目录树过大
+                if folder_count > _INDEX_MAX_FOLDERS:
+                    truncated = True
+                    break
+                level = next_level
+        
+        return {
+            "current_path": relative_path,
+            "folder_count": folder_count,
+            "file_count": file_count,
+            "total_size": self.format_file_size(total_size),
+            "total_size_bytes": total_size,
+            "truncated": truncated
+        }
+    
     def serve_stats_api(self):
         """服务统计信息API"""
         try:
             stats = self.get_system_stats()
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json; charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(json.dumps(stats, ensure_ascii=False).encode('utf-8'))
+            self.send_api_data(stats)
         except Exception as e:
             self.log_error("Stats error: %s", str(e))
             self.send_error_response(500, f"Stats error: {str(e)}")
@@ -351,61 +735,168 @@ class ByUsiCDNRequestHandler(http.server.SimpleHTTPRequestHandler):
     def serve_file_download(self, path):
         """服务文件下载"""
         try:
-            filename = path.replace('/download/', '')
-            file_path = self.cdn_path / urllib.parse.unquote(filename)
+            filename = urllib.parse.unquote(path[len('/download/'):])
+            file_path = os.path.join(_CDN_ROOT, filename)
             
-            # 安全检查
-            try:
-                file_path.resolve().relative_to(self.cdn_path.resolve())
-            except ValueError:
+            # 安全检查：解析符号链接后仍须位于cdnData目录内
+            if not _is_inside_cdn_root(file_path):
                 self.send_error_response(403, "Access denied")
                 return
             
-            if not file_path.exists() or not file_path.is_file():
+            # 只stat一次，同时用于存在性、类型检查和Content-Length
+            try:
+                file_stat = os.stat(file_path)
+            except OSError:
+                file_stat = None
+            if file_stat is None or not S_ISREG(file_stat.st_mode):
                 self.send_error_response(404, "File not found")
                 return
             
-            # 设置下载头
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/octet-stream')
-            self.send_header('Content-Disposition', f'attachment; filename="{file_path.name}"')
-            self.send_header('Content-Length', str(file_path.stat().st_size))
-            self.end_headers()
-            
-            # 发送文件内容
             with open(file_path, 'rb') as f:
-                self.wfile.write(f.read())
+                # 设置下载头，支持断点续传
+                self.send_file(f, file_stat.st_size, {
+                    'Content-Type': 'application/octet-stream',
+                    'Content-Disposition': f'attachment; filename="{os.path.basename(file_path)}"'
+                })
                 
         except Exception as e:
             self.log_error("Download error: %s", str(e))
             self.send_error_response(500, f"Download error: {str(e)}")
     
+    def send_file(self, f, file_size: int, headers: Dict[str, str]):
+        """发送文件响应，支持单段Range请求"""
+        try:
+            byte_range = self.parse_range(self.headers.get('Range'), file_size)
+        except ValueError:
+            # 请求范围超出文件大小
+            self.send_response(416)
+            self.send_header('Content-Range', f'bytes */{file_size}')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        
+        if byte_range is None:
+            start, length = 0, file_size
+            self.send_response(200)
+        else:
+            start, end = byte_range
+            length = end - start + 1
+            self.send_response(206)
+            self.send_header('Content-Range', f'bytes {start}-{end}/{file_size}')
+        
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Accept-Ranges', 'bytes')
+        self.send_header('Content-Length', str(length))
+        self.end_headers()
+        self.send_file_body(f, length, start)
+    
+    @staticmethod
+    def parse_range(range_header: str, size: int):
+        """解析Range请求头，返回(起始, 结束)闭区间
+        
+        没有Range头、格式不支持或包含多段范围时返回None，按完整文件响应；
+        范围无法满足时抛出ValueError。
+        """
+        if not range_header or not range_header.startswith('bytes='):
+            return None
+        
+        start_text, sep, end_text = range_header[6:].strip().partition('-')
+        if not sep or ',' in end_text:
+            return None
+        start_text, end_text = start_text.strip(), end_text.strip()
+        if not (start_text or end_text):
+            return None
+        if (start_text and not start_text.isdigit()) or (end_text and not end_text.isdigit()):
+            return None
+        
+        if start_text:
+            start = int(start_text)
+            end = int(end_text) if end_text else size - 1
+            if end_text and end < start:
+                return None
+        else:
+            # bytes=-N 表示最后N个字节
+            suffix = int(end_text)
+            if suffix == 0:
+                raise ValueError("empty suffix range")
+            start = max(size - suffix, 0)
+            end = size - 1
+        
+        if start >= size:
+            raise ValueError("range not satisfiable")
+        return start, min(end, size - 1)
+    
+    def send_file_body(self, f, size: int, offset: int = 0):
+        """发送文件内容，支持时使用零拷贝的os.sendfile，否则由socket.sendfile分块发送"""
+        # Linux下用TCP_CORK让响应头与文件首段数据合并到同一个报文中
+        cork = hasattr(socket, 'TCP_CORK')
+        if cork:
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_CORK, 1)
+        try:
+            self.wfile.flush()
+            if _HAS_SENDFILE:
+                # socket.sendfile会处理短写，并在连接设置了超时时等待socket可写
+                self.connection.sendfile(f, offset, size)
+            else:
+                self.send_file_chunks(f, size, offset)
+        finally:
+            if cork:
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_CORK, 0)
+    
+    def send_file_chunks(self, f, size: int, offset: int = 0):
+        """不支持os.sendfile的平台上用固定缓冲区分块发送，内存占用与文件大小无关"""
+        f.seek(offset)
+        view = memoryview(bytearray(min(size, _SEND_BLOCK_SIZE)))
+        while size > 0:
+            n = f.readinto(view[:size])
+            if not n:
+                break
+            self.connection.sendall(view[:n])
+            size -= n
+    
     def scan_cdn_folder(self, relative_path: str = "") -> Dict[str, Any]:
         """扫描CDN文件夹"""
         target_path = self.cdn_path / relative_path if relative_path else self.cdn_path
         
-        if not target_path.exists():
-            return {
-                "files": [], 
-                "folders": [], 
-                "folder_count": 0, 
-                "file_count": 0, 
-                "total_size": "0 B",
-                "current_path": relative_path,
-                "parent_path": self.get_parent_path(relative_path)
-            }
+        try:
+            # 安全检查：确保路径在cdnData目录内
+            if _is_inside_cdn_root(target_path):
+                dir_stat = target_path.stat()
+            else:
+                self.log_error("Path traversal attempt: %s", relative_path)
+                dir_stat = None
+        except OSError:
+            dir_stat = None
         
-        if not target_path.is_dir():
+        # 目录不存在或不是目录时返回空列表
+        if dir_stat is None or not S_ISDIR(dir_stat.st_mode):
             return {
-                "files": [], 
-                "folders": [], 
-                "folder_count": 0, 
-                "file_count": 0, 
-                "total_size": "0 B",
+                **_EMPTY_LISTING,
                 "current_path": relative_path,
                 "parent_path": self.get_parent_path(relative_path)
             }
         
+        # 目录未变化且未过期时直接返回缓存
+        now = time.monotonic()
+        with _LIST_CACHE_LOCK:
+            cached = _LIST_CACHE.get(relative_path)
+            if cached and cached[0] == dir_stat.st_mtime_ns and now - cached[1] < _LIST_CACHE_TTL:
+                _LIST_CACHE.move_to_end(relative_path)
+                return cached[2]
+        
+        result = self.read_cdn_folder(target_path, relative_path)
+        
+        with _LIST_CACHE_LOCK:
+            _LIST_CACHE[relative_path] = (dir_stat.st_mtime_ns, now, result)
+            _LIST_CACHE.move_to_end(relative_path)
+            while len(_LIST_CACHE) > _LIST_CACHE_SIZE:
+                _LIST_CACHE.popitem(last=False)
+        
+        return result
+    
+    def read_cdn_folder(self, target_path: Path, relative_path: str) -> Dict[str, Any]:
+        """读取目录内容，生成文件和文件夹列表"""
         files_data = []
         folders_data = []
         total_size = 0
@@ -413,29 +904,41 @@ class ByUsiCDNRequestHandler(http.server.SimpleHTTPRequestHandler):
         file_count = 0
         
         try:
-            # 扫描文件和文件夹
-            for item in target_path.iterdir():
-                if item.is_file():
-                    stat = item.stat()
-                    file_info = {
-                        "name": item.name,
-                        "path": str(item.relative_to(self.cdn_path)),
-                        "size": self.format_file_size(stat.st_size),
-                        "size_bytes": stat.st_size,
-                        "modified": datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
-                        "type": self.get_file_type(item.name)
-                    }
-                    files_data.append(file_info)
-                    total_size += stat.st_size
-                    file_count += 1
-                elif item.is_dir():
-                    folder_info = {
-                        "name": item.name,
-                        "path": str(item.relative_to(self.cdn_path)),
-                        "modified": datetime.fromtimestamp(item.stat().st_mtime).strftime('%Y-%m-%d %H:%M:%S')
-                    }
-                    folders_data.append(folder_info)
-                    folder_count += 1
+            # 子项相对路径的公共前缀，只计算一次
+            prefix = str(target_path.relative_to(self.cdn_path))
+            if prefix == '.':
+                prefix = ''
+            
+            # 扫描文件和文件夹，每项只stat一次，类型判断和大小、时间都复用该结果
+            with os.scandir(target_path) as it:
+                for entry in it:
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        # 失效的符号链接等无法stat的条目直接跳过
+                        continue
+                    
+                    name = entry.name
+                    if S_ISREG(stat.st_mode):
+                        file_info = {
+                            "name": name,
+                            "path": os.path.join(prefix, name),
+                            "size": self.format_file_size(stat.st_size),
+                            "size_bytes": stat.st_size,
+                            "modified": _format_mtime(int(stat.st_mtime)),
+                            "type": self.get_file_type(name)
+                        }
+                        files_data.append(file_info)
+                        total_size += stat.st_size
+                        file_count += 1
+                    elif S_ISDIR(stat.st_mode):
+                        folder_info = {
+                            "name": name,
+                            "path": os.path.join(prefix, name),
+                            "modified": _format_mtime(int(stat.st_mtime))
+                        }
+                        folders_data.append(folder_info)
+                        folder_count += 1
         
         except Exception as e:
             self.log_error("Folder scanning error: %s", str(e))
@@ -467,25 +970,22 @@ class ByUsiCDNRequestHandler(http.server.SimpleHTTPRequestHandler):
         return '/'.join(path_parts[:-1])
     
     def get_system_stats(self) -> Dict[str, Any]:
-        """获取系统统计信息"""
-        import platform
-        try:
-            import psutil
-            HAS_PSUTIL = True
-        except ImportError:
-            HAS_PSUTIL = False
+        """获取系统统计信息，结果缓存_STATS_TTL秒"""
+        now = time.monotonic()
+        cached = _STATS_CACHE["data"]
+        if cached is not None and now - _STATS_CACHE["time"] < _STATS_TTL:
+            return cached
         
+        stats = self.collect_system_stats()
+        _STATS_CACHE["data"] = stats
+        _STATS_CACHE["time"] = now
+        return stats
+    
+    def collect_system_stats(self) -> Dict[str, Any]:
+        """采集系统统计信息"""
         try:
-            # 获取系统信息
-            system_info = {
-                "platform": platform.system(),
-                "platform_version": platform.version(),
-                "processor": platform.processor(),
-                "hostname": platform.node()
-            }
-            
             stats = {
-                "system": system_info,
+                "system": _SYSTEM_INFO,
                 "uptime": "Unknown"
             }
             
@@ -494,9 +994,10 @@ class ByUsiCDNRequestHandler(http.server.SimpleHTTPRequestHandler):
                 memory = psutil.virtual_memory()
                 disk = psutil.disk_usage('.')
                 
-                # 获取服务器运行时间
-                boot_time = datetime.fromtimestamp(psutil.boot_time())
-                uptime = datetime.now() - boot_time
+                # 获取服务器运行时间，开机时间只需读取一次
+                if _STATS_CACHE["boot_time"] is None:
+                    _STATS_CACHE["boot_time"] = datetime.fromtimestamp(psutil.boot_time())
+                uptime = datetime.now() - _STATS_CACHE["boot_time"]
                 
                 stats.update({
                     "memory": {
@@ -518,30 +1019,49 @@ class ByUsiCDNRequestHandler(http.server.SimpleHTTPRequestHandler):
         except Exception as e:
             return {"error": str(e)}
     
-    def format_file_size(self, size_bytes: int) -> str:
-        """格式化文件大小"""
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def format_file_size(size_bytes: int) -> str:
+        """格式化文件大小，相同大小的结果会被缓存"""
         if size_bytes == 0:
             return "0 B"
         
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.2f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.2f} PB"
+        # 由二进制位数直接确定单位，无需循环除法
+        index = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+        unit, divisor = _SIZE_UNITS[index]
+        return f"{size_bytes / divisor:.2f} {unit}"
     
-    def get_file_type(self, filename: str) -> str:
+    @staticmethod
+    def get_file_type(filename: str) -> str:
         """获取文件类型"""
-        ext = Path(filename).suffix.lower()
-        file_types = {
-            '.jpg': 'image', '.jpeg': 'image', '.png': 'image', '.gif': 'image', '.bmp': 'image', '.webp': 'image',
-            '.pdf': 'document', '.doc': 'document', '.docx': 'document', '.ppt': 'document', '.pptx': 'document',
-            '.txt': 'text', '.md': 'text', '.json': 'text', '.xml': 'text', '.csv': 'text',
-            '.zip': 'archive', '.rar': 'archive', '.7z': 'archive', '.tar': 'archive', '.gz': 'archive',
-            '.mp4': 'video', '.avi': 'video', '.mkv': 'video', '.mov': 'video', '.wmv': 'video',
-            '.mp3': 'audio', '.wav': 'audio', '.flac': 'audio', '.aac': 'audio', '.ogg': 'audio',
-            '.exe': 'executable', '.msi': 'executable'
-        }
-        return file_types.get(ext, 'file')
+        dot = filename.rfind('.')
+        ext = filename[dot:].lower() if dot > 0 else ''
+        return _FILE_TYPES.get(ext, 'file')
+
+class ByUsiCDNServer(http.server.ThreadingHTTPServer):
+    """多线程HTTP服务器，每个连接由独立线程处理"""
+    
+    daemon_threads = True
+    allow_reuse_address = True
+    
+    # TCPServer默认的监听队列只有5，并发连接较多时会被直接拒绝
+    request_queue_size = socket.SOMAXCONN
+    
+    # 多进程模式下启用SO_REUSEPORT，多个进程监听同一端口
+    reuse_port = False
+    
+    def server_bind(self):
+        """绑定端口，按需启用SO_REUSEPORT"""
+        if self.reuse_port:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+def spawn_workers(count: int) -> bool:
+    """fork出count个工作进程，返回当前进程是否为工作进程"""
+    for _ in range(count):
+        if os.fork() == 0:
+            return True
+    return False
 
 def display_banner():
     """显示启动横幅"""
@@ -572,11 +1092,13 @@ def display_banner():
     info_table.add_row("CDN Mapping:", "All non-API paths → ./cdnData/")
     info_table.add_row("Protected Paths:", ", ".join(CONFIG['protected_paths']))
     info_table.add_row("Theme Color:", CONFIG['theme_color'])
+    info_table.add_row("Workers:", str(CONFIG['workers']))
     
     console.print(Panel(info_table, title="📋 Configuration Info", border_style="cyan"))
 
 def main():
     """主函数"""
+    is_worker = False
     try:
         # 创建必要的文件夹
         cdn_path = Path(CONFIG["cdn_data_folder"])
@@ -594,31 +1116,45 @@ def main():
         # 设置自定义请求处理器
         handler = ByUsiCDNRequestHandler
         
-        # 创建服务器
-        with socketserver.TCPServer((CONFIG["host"], CONFIG["port"]), handler) as httpd:
-            if HAS_RICH:
-                console.print(f"\n🎉 [bold green]Server started successfully![/bold green]")
-                console.print(f"\n📁 CDN File Access Examples:")
-                console.print(f"   http://{CONFIG['host']}:{CONFIG['port']}/              → {cdn_path.absolute()}/")
-                console.print(f"   http://{CONFIG['host']}:{CONFIG['port']}/file.txt      → {cdn_path.absolute()}/file.txt")
-                console.print(f"   http://{CONFIG['host']}:{CONFIG['port']}/folder/       → {cdn_path.absolute()}/folder/")
-                console.print(f"\n📊 API endpoints:")
-                console.print(f"   http://{CONFIG['host']}:{CONFIG['port']}/api/files")
-                console.print(f"   http://{CONFIG['host']}:{CONFIG['port']}/api/stats")
-                console.print(f"\n⛔ Protected paths:")
-                for path in CONFIG['protected_paths']:
-                    console.print(f"   http://{CONFIG['host']}:{CONFIG['port']}{path}")
-                console.print(f"\n⏹️  [bold yellow]Press Ctrl+C to stop server[/bold yellow]\n")
+        # 多进程模式：每个进程各自以SO_REUSEPORT监听同一端口，由内核分发连接
+        workers = CONFIG["workers"]
+        if workers > 1:
+            if hasattr(socket, 'SO_REUSEPORT') and hasattr(os, 'fork'):
+                ByUsiCDNServer.reuse_port = True
+                is_worker = spawn_workers(workers - 1)
             else:
-                print(f"\nServer started successfully!")
-                print(f"CDN File Access Examples:")
-                print(f"  http://{CONFIG['host']}:{CONFIG['port']}/ → {cdn_path.absolute()}/")
-                print(f"Press Ctrl+C to stop server\n")
+                logging.warning("SO_REUSEPORT/fork not supported on this platform, running a single process")
+        
+        # 创建服务器
+        with ByUsiCDNServer((CONFIG["host"], CONFIG["port"]), handler) as httpd:
+            # 启动信息只由主进程输出
+            if not is_worker:
+                if HAS_RICH:
+                    console.print(f"\n🎉 [bold green]Server started successfully![/bold green]")
+                    console.print(f"\n📁 CDN File Access Examples:")
+                    console.print(f"   http://{CONFIG['host']}:{CONFIG['port']}/              → {cdn_path.absolute()}/")
+                    console.print(f"   http://{CONFIG['host']}:{CONFIG['port']}/file.txt      → {cdn_path.absolute()}/file.txt")
+                    console.print(f"   http://{CONFIG['host']}:{CONFIG['port']}/folder/       → {cdn_path.absolute()}/folder/")
+                    console.print(f"\n📊 API endpoints:")
+                    console.print(f"   http://{CONFIG['host']}:{CONFIG['port']}/api/files")
+                    console.print(f"   http://{CONFIG['host']}:{CONFIG['port']}/api/stats")
+                    console.print(f"   http://{CONFIG['host']}:{CONFIG['port']}/api/index")
+                    console.print(f"\n⛔ Protected paths:")
+                    for path in CONFIG['protected_paths']:
+                        console.print(f"   http://{CONFIG['host']}:{CONFIG['port']}{path}")
+                    console.print(f"\n⏹️  [bold yellow]Press Ctrl+C to stop server[/bold yellow]\n")
+                else:
+                    print(f"\nServer started successfully!")
+                    print(f"CDN File Access Examples:")
+                    print(f"  http://{CONFIG['host']}:{CONFIG['port']}/ → {cdn_path.absolute()}/")
+                    print(f"Press Ctrl+C to stop server\n")
             
             # 启动服务器
             httpd.serve_forever()
             
     except KeyboardInterrupt:
+        if is_worker:
+            return
         if HAS_RICH:
             console.print(f"\n\n[bold yellow]👋 Server stopped safely[/bold yellow]")
         else: